@@ -6,15 +6,22 @@ Ready for GitHub deployment
 
 import streamlit as st
 from pathlib import Path
+from collections import defaultdict
+import os
 import time
+import uuid
 from utils import (
     get_audio_files,
-    convert_mp4_to_mp3,
+    load_audio,
     transcribe_audio,
     get_file_size,
     check_gpu_available,
     validate_ffmpeg,
-    get_system_info
+    get_system_info,
+    get_compute_type,
+    load_whisper_model,
+    MODEL_CACHE_SIZE,
+    PERFORMANCE_PROFILES
 )
 
 # ==================== PAGE CONFIGURATION ====================
@@ -26,188 +33,72 @@ st.set_page_config(
 )
 
 # ==================== PROFESSIONAL CSS ====================
-st.markdown("""
-<style>
-    /* Dark professional theme */
-    .stApp {
-        background: linear-gradient(135deg, #0a0e27 0%, #1a1f3a 100%);
-    }
-    
-    [data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #151b2f 0%, #0a0e27 100%);
-        border-right: 1px solid #2a3f5f;
-    }
-    
-    /* Header styling */
-    .header-title {
-        text-align: center;
-        padding: 2.5rem 2rem;
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(30, 64, 175, 0.2);
-        border: 1px solid rgba(59, 130, 246, 0.5);
-    }
-    
-    .header-title h1 {
-        color: white;
-        font-size: 2.8em;
-        margin: 0;
-        font-weight: 700;
-        text-shadow: 0 2px 8px rgba(0, 0, 0, 0.3);
-    }
-    
-    .header-title p {
-        color: rgba(255, 255, 255, 0.9);
-        font-size: 1.1em;
-        margin: 0.5rem 0 0 0;
-        font-weight: 300;
-    }
-    
-    /* System info card */
-    .system-card {
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
-        padding: 1.5rem;
-        border-radius: 14px;
-        border: 1px solid rgba(59, 130, 246, 0.3);
-        margin: 1.5rem 0;
-    }
-    
-    .system-card h3 {
-        color: #3b82f6;
-        font-size: 1.1em;
-        margin-top: 0;
-        font-weight: 600;
-    }
-    
-    .system-stat {
-        display: flex;
-        justify-content: space-between;
-        padding: 0.5rem 0;
-        color: rgba(255, 255, 255, 0.85);
-        font-size: 0.95em;
-        border-bottom: 1px solid rgba(59, 130, 246, 0.15);
-    }
-    
-    .system-stat:last-child {
-        border-bottom: none;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        width: 100%;
-        background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%);
-        color: white;
-        font-size: 1.1em;
-        font-weight: 600;
-        padding: 1.2rem 2rem;
-        border-radius: 12px;
-        border: none;
-        box-shadow: 0 6px 20px rgba(30, 64, 175, 0.3);
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 30px rgba(30, 64, 175, 0.4);
-    }
-    
-    /* Status boxes */
-    .status-success {
-        background: rgba(34, 197, 94, 0.15);
-        border: 1px solid #22c55e;
-        border-radius: 10px;
-        padding: 1.2rem;
-        color: #22c55e;
-        margin: 1rem 0;
-    }
-    
-    .status-error {
-        background: rgba(239, 68, 68, 0.15);
-        border: 1px solid #ef4444;
-        border-radius: 10px;
-        padding: 1.2rem;
-        color: #ef4444;
-        margin: 1rem 0;
-    }
-    
-    .status-warning {
-        background: rgba(245, 158, 11, 0.15);
-        border: 1px solid #f59e0b;
-        border-radius: 10px;
-        padding: 1.2rem;
-        color: #f59e0b;
-        margin: 1rem 0;
-    }
-    
-    .status-info {
-        background: rgba(59, 130, 246, 0.15);
-        border: 1px solid #3b82f6;
-        border-radius: 10px;
-        padding: 1.2rem;
-        color: #93c5fd;
-        margin: 1rem 0;
-    }
-    
-    /* Transcript box */
-    .transcript-box {
-        background: #0a0e27;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 1px solid #2a3f5f;
-        max-height: 500px;
-        overflow-y: auto;
-        font-family: 'Courier New', monospace;
-        color: #e0e7ff;
-        line-height: 1.8;
-        font-size: 0.95em;
-    }
-    
-    /* Progress bar */
-    .stProgress > div > div {
-        background: linear-gradient(90deg, #1e40af 0%, #3b82f6 100%);
-    }
-    
-    /* File info card */
-    .info-card {
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(37, 99, 235, 0.05) 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 1px solid rgba(59, 130, 246, 0.3);
-        margin: 1rem 0;
-    }
-    
-    .info-card h4 {
-        color: #3b82f6;
-        margin-top: 0;
-    }
-    
-    /* Sidebar styling */
-    .sidebar-section {
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.05) 0%, rgba(37, 99, 235, 0.02) 100%);
-        padding: 1.2rem;
-        border-radius: 12px;
-        border: 1px solid rgba(59, 130, 246, 0.2);
-        margin-bottom: 1.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def load_css(path: str) -> str:
+    """Read the theme stylesheet once per server process"""
+    return Path(path).read_text(encoding="utf-8")
+
+CSS_PATH = Path(__file__).resolve().parent / "assets" / "theme.css"
+st.markdown(f"<style>{load_css(str(CSS_PATH))}</style>", unsafe_allow_html=True)
 
 # ==================== INITIALIZE SESSION STATE ====================
 if 'transcription_done' not in st.session_state:
     st.session_state.transcription_done = False
-if 'transcript_text' not in st.session_state:
-    st.session_state.transcript_text = ""
+if 'transcript_path' not in st.session_state:
+    st.session_state.transcript_path = None
 if 'output_files' not in st.session_state:
     st.session_state.output_files = {}
 
 # ==================== PATHS ====================
-BASE_DIR = Path(r"C:\Users\LKK\Desktop\Transcript Generator")
-INPUT_DIR = BASE_DIR / "Input"
-OUTPUT_DIR = BASE_DIR / "Output"
+@st.cache_resource(show_spinner=False)
+def ensure_dirs(base: Path):
+    """Create Input/Output once per server process instead of every rerun"""
+    input_dir = base / "Input"
+    output_dir = base / "Output"
+    input_dir.mkdir(parents=True, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return input_dir, output_dir
+
+BASE_DIR = Path(os.environ.get("TRANSCRIPT_BASE_DIR") or Path(__file__).resolve().parent)
+INPUT_DIR, OUTPUT_DIR = ensure_dirs(BASE_DIR)
+
+def input_dir_mtime_ns() -> int:
+    """Input folder mtime, re-creating the folders if they were deleted
+    while the server was running (ensure_dirs only runs once)"""
+    try:
+        return os.stat(INPUT_DIR).st_mtime_ns
+    except FileNotFoundError:
+        ensure_dirs.clear()
+        ensure_dirs(BASE_DIR)
+        return os.stat(INPUT_DIR).st_mtime_ns
+
+# ==================== MODEL CACHING ====================
+# st.cache_resource (not st.cache_data) is the right decorator for heavy,
+# unhashable objects such as ML models: the loaded instance is shared across
+# reruns and sessions instead of being pickled or reloaded on every click.
+@st.cache_resource(show_spinner="Loading Whisper model…", max_entries=MODEL_CACHE_SIZE)
+def get_whisper_model(model_name: str, device: str, compute_type: str):
+    """Load the Whisper model once per (model_name, device, compute_type)"""
+    return load_whisper_model(model_name, device, compute_type)
+
+# ==================== CACHED SYSTEM PROBES ====================
+# Streamlit reruns the whole script on every widget interaction, so the
+# psutil/CUDA queries, the ffmpeg subprocess and the Input folder scan are
+# cached instead of repeated per click.
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_system_info():
+    """System specs, refreshed at most once a minute"""
+    return get_system_info()
+
+@st.cache_data(show_spinner=False)
+def cached_ffmpeg_ok() -> bool:
+    """FFmpeg presence, checked once per server process"""
+    return validate_ffmpeg()
 
-INPUT_DIR.mkdir(parents=True, exist_ok=True)
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_audio_files(input_dir: str, mtime_ns: int):
+    """Audio file list keyed on the folder mtime so new files still appear"""
+    return get_audio_files(Path(input_dir))
 
 # ==================== HEADER ====================
 st.markdown("""
@@ -217,76 +108,139 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# ==================== LANGUAGES ====================
+LANGUAGE_MAP = (
+    ("Auto-Detect (Recommended)", None),
+    ("English", "en"),
+    ("Chinese (Mandarin)", "zh"),
+    ("Cantonese", "yue"),
+    ("Spanish", "es"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Japanese", "ja"),
+    ("Korean", "ko")
+)
+LANGUAGE_LABELS = tuple(label for label, _ in LANGUAGE_MAP)
+LANGUAGE_CODES = dict(LANGUAGE_MAP)
+
+# ==================== PROGRESS THROTTLING ====================
+def throttled(callback, interval: float = 0.1):
+    """Forward progress ticks at most every `interval` seconds
+    
+    Each progress_bar/status_text update is a websocket message, so ticks
+    are dropped unless the integer percent changed and the interval has
+    elapsed. 100% is always delivered.
+    """
+    last = {'time': 0.0, 'percent': None}
+    
+    def wrapper(percent, *args):
+        now = time.monotonic()
+        if percent >= 100 or (now - last['time'] >= interval and int(percent) != last['percent']):
+            last['time'] = now
+            last['percent'] = int(percent)
+            callback(percent, *args)
+    
+    return wrapper
+
+# ==================== OUTPUT WRITING ====================
+def reset_results() -> None:
+    """Forget the last run so the result panel is hidden"""
+    st.session_state.transcription_done = False
+    st.session_state.transcript_path = None
+    st.session_state.output_files = {}
+
+def write_output(path: Path, text: str) -> None:
+    """Write a UTF-8 result file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def file_stamp(path: Path) -> tuple:
+    """Identity of the file version at path (a replace changes the inode)"""
+    info = path.stat()
+    return info.st_ino, info.st_mtime_ns, info.st_size
+
+# ==================== HTML TEMPLATES ====================
+# Built once at import; reruns only fill in the values with format_map
+SYS_CARD_TMPL = """
+<div class="system-card">
+    <div class="system-stat">
+        <span><strong>OS</strong></span>
+        <span>{os}</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>CPU Cores</strong></span>
+        <span>{cpu_count} cores</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>CPU Speed</strong></span>
+        <span>{cpu_freq}</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>Total RAM</strong></span>
+        <span>{ram_total}</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>Available RAM</strong></span>
+        <span>{ram_available}</span>
+    </div>
+</div>
+"""
+
+GPU_CARD_TMPL = """
+<div class="system-card">
+    <div class="system-stat" style="border-bottom: none;">
+        <span style="color: #22c55e;"><strong>✅ GPU Enabled</strong></span>
+    </div>
+    <div class="system-stat">
+        <span><strong>GPU</strong></span>
+        <span>{gpu_name}</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>VRAM</strong></span>
+        <span>{gpu_memory}</span>
+    </div>
+    <div class="system-stat">
+        <span><strong>CUDA</strong></span>
+        <span>v{cuda_version}</span>
+    </div>
+</div>
+"""
+
+NO_GPU_CARD = """
+<div class="system-card">
+    <div class="system-stat" style="border-bottom: none; color: #f59e0b;">
+        <strong>⚠️ GPU Not Available</strong>
+    </div>
+    <p style="font-size: 0.9em; color: rgba(255, 255, 255, 0.7); margin-top: 0.5rem;">
+        Running in CPU mode. Processing will be slower.
+    </p>
+</div>
+"""
+
 # ==================== SIDEBAR: SYSTEM INFORMATION ====================
 with st.sidebar:
     st.markdown("### 💻 System Information")
     
-    sys_info = get_system_info()
+    sys_info = cached_system_info()
+    device = "cuda" if sys_info['gpu_available'] else "cpu"
+    
+    # Missing keys render as N/A instead of raising inside format_map
+    sys_fields = defaultdict(lambda: 'N/A', sys_info)
     
     with st.expander("🖥️ System Specs", expanded=True):
-        st.markdown(f"""
-        <div class="system-card">
-            <div class="system-stat">
-                <span><strong>OS</strong></span>
-                <span>{sys_info.get('os')}</span>
-            </div>
-            <div class="system-stat">
-                <span><strong>CPU Cores</strong></span>
-                <span>{sys_info.get('cpu_count')} cores</span>
-            </div>
-            <div class="system-stat">
-                <span><strong>CPU Speed</strong></span>
-                <span>{sys_info.get('cpu_freq')}</span>
-            </div>
-            <div class="system-stat">
-                <span><strong>Total RAM</strong></span>
-                <span>{sys_info.get('ram_total')}</span>
-            </div>
-            <div class="system-stat">
-                <span><strong>Available RAM</strong></span>
-                <span>{sys_info.get('ram_available')}</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SYS_CARD_TMPL.format_map(sys_fields), unsafe_allow_html=True)
     
     with st.expander("🚀 GPU Information", expanded=True):
         if sys_info.get('gpu_available'):
-            st.markdown(f"""
-            <div class="system-card">
-                <div class="system-stat" style="border-bottom: none;">
-                    <span style="color: #22c55e;"><strong>✅ GPU Enabled</strong></span>
-                </div>
-                <div class="system-stat">
-                    <span><strong>GPU</strong></span>
-                    <span>{sys_info.get('gpu_name')}</span>
-                </div>
-                <div class="system-stat">
-                    <span><strong>VRAM</strong></span>
-                    <span>{sys_info.get('gpu_memory')}</span>
-                </div>
-                <div class="system-stat">
-                    <span><strong>CUDA</strong></span>
-                    <span>v{sys_info.get('cuda_version')}</span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(GPU_CARD_TMPL.format_map(sys_fields), unsafe_allow_html=True)
         else:
-            st.markdown("""
-            <div class="system-card">
-                <div class="system-stat" style="border-bottom: none; color: #f59e0b;">
-                    <strong>⚠️ GPU Not Available</strong>
-                </div>
-                <p style="font-size: 0.9em; color: rgba(255, 255, 255, 0.7); margin-top: 0.5rem;">
-                    Running in CPU mode. Processing will be slower.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(NO_GPU_CARD, unsafe_allow_html=True)
     
     st.divider()
     
     # ==================== FILE SELECTION ====================
     st.markdown("### 📁 Audio File")
-    audio_files = get_audio_files(INPUT_DIR)
+    audio_files = cached_audio_files(str(INPUT_DIR), input_dir_mtime_ns())
     
     if not audio_files:
         st.warning("⚠️ No audio files found in Input folder")
@@ -303,33 +257,31 @@ with st.sidebar:
     
     # ==================== LANGUAGE SELECTION ====================
     st.markdown("### 🌍 Language")
-    language_map = {
-        "Auto-Detect (Recommended)": None,
-        "English": "en",
-        "Chinese (Mandarin)": "zh",
-        "Cantonese": "yue",
-        "Spanish": "es",
-        "French": "fr",
-        "German": "de",
-        "Japanese": "ja",
-        "Korean": "ko"
-    }
-    
     selected_language = st.radio(
         "Select language",
-        list(language_map.keys()),
+        LANGUAGE_LABELS,
         index=0,
         help="Auto-detect usually works best"
     )
     
-    language_code = language_map[selected_language]
+    language_code = LANGUAGE_CODES[selected_language]
     
     st.divider()
     
     # ==================== SETTINGS ====================
     st.markdown("### ⚙️ Settings")
-    if not validate_ffmpeg():
-        st.warning("❌ FFmpeg not found - MP4 conversion unavailable")
+    if not cached_ffmpeg_ok():
+        st.warning("⚠️ FFmpeg not found - using the built-in decoder (no decode progress)")
+    
+    performance_profile = st.radio(
+        "Performance",
+        list(PERFORMANCE_PROFILES),
+        index=0,
+        horizontal=True,
+        help="Speed: greedy decoding with int8 weights. Quality: beam search 5 with float16 on GPU."
+    )
+    compute_type = get_compute_type(device, performance_profile)
+    beam_size = PERFORMANCE_PROFILES[performance_profile]["beam_size"]
     
     st.info("""
     **Transcription Model**: Turbo
@@ -339,7 +291,9 @@ with st.sidebar:
     """)
 
 # ==================== MAIN CONTENT ====================
-if selected_file:
+@st.fragment
+def transcription_panel(selected_file, selected_language, language_code, device, compute_type, beam_size):
+    """File card, transcription run and results - reruns without the sidebar"""
     file_path = INPUT_DIR / selected_file
     file_size = get_file_size(file_path)
     
@@ -357,70 +311,81 @@ if selected_file:
         start_button = st.button("🚀 Start Transcription", type="primary", use_container_width=True)
     
     if start_button:
-        st.session_state.transcription_done = False
-        st.session_state.transcript_text = ""
+        reset_results()
         start_time = time.time()
         
+        base_name = file_path.stem
+        srt_path = OUTPUT_DIR / f"{base_name}_transcript.srt"
+        txt_path = OUTPUT_DIR / f"{base_name}_transcript.txt"
+        
+        # Sessions share Output/, so each run writes private temp files and
+        # renames them into place; a concurrent run of the same input can
+        # then never interleave with this one
+        token = uuid.uuid4().hex[:8]
+        srt_tmp = srt_path.with_name(f"{srt_path.name}.{token}.tmp")
+        txt_tmp = txt_path.with_name(f"{txt_path.name}.{token}.tmp")
+        
+        # One status container and one progress bar cover the whole run
+        status = st.status("Processing…", expanded=True)
+        
         try:
-            # MP4 Conversion
-            if file_path.suffix.lower() == '.mp4':
-                st.markdown("### 🔄 Converting MP4 to MP3...")
+            with status:
                 progress_bar = st.progress(0)
-                status_text = st.empty()
                 
-                mp3_path = OUTPUT_DIR / f"{file_path.stem}_audio.mp3"
+                # Audio is decoded once, straight into memory, and the array is
+                # handed to the model; without FFmpeg only faster-whisper's
+                # own decoder is available
+                if cached_ffmpeg_ok():
+                    status.update(label="🔄 Decoding audio…")
+                    
+                    @throttled
+                    def update_progress(percent):
+                        progress_bar.progress(percent / 100, text=f"Decoding: {percent}%")
+                    
+                    audio_input = load_audio(str(file_path), update_progress)
+                else:
+                    audio_input = str(file_path)
                 
-                def update_progress(percent):
-                    progress_bar.progress(percent / 100)
-                    status_text.text(f"Conversion: {percent}%")
+                OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
                 
-                convert_mp4_to_mp3(str(file_path), str(mp3_path), update_progress)
+                # Transcription - the SRT is streamed to disk by
+                # transcribe_audio, so it is never held in memory as a string
+                status.update(label="🎙️ Transcribing audio…")
                 
-                st.markdown('<div class="status-success">✅ MP3 conversion complete</div>', unsafe_allow_html=True)
-                audio_file_path = mp3_path
-            else:
-                audio_file_path = file_path
-            
-            # Transcription
-            st.markdown("### 🎙️ Transcribing Audio...")
-            st.markdown('<div class="status-info">⏳ Processing... Please wait</div>', unsafe_allow_html=True)
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            def update_transcribe_progress(percent, message):
-                progress_bar.progress(percent / 100)
-                status_text.text(f"{message}")
-            
-            result = transcribe_audio(
-                str(audio_file_path),
-                model_name="turbo",
-                language=language_code,
-                progress_callback=update_transcribe_progress
-            )
-            
-            # Save Results
-            st.markdown("### 💾 Saving Results...")
-            
-            base_name = file_path.stem
-            srt_path = OUTPUT_DIR / f"{base_name}_transcript.srt"
-            txt_path = OUTPUT_DIR / f"{base_name}_transcript.txt"
-            
-            with open(srt_path, 'w', encoding='utf-8') as f:
-                f.write(result['srt'])
+                @throttled
+                def update_transcribe_progress(percent, message):
+                    progress_bar.progress(percent / 100, text=message)
+                
+                result = transcribe_audio(
+                    audio_input,
+                    model=get_whisper_model("turbo", device, compute_type),
+                    language=language_code,
+                    compute_type=compute_type,
+                    beam_size=beam_size,
+                    srt_output_path=str(srt_tmp),
+                    progress_callback=update_transcribe_progress
+                )
+                
+                # Save Results
+                status.update(label="💾 Saving results…")
+                write_output(txt_tmp, result['text'])
+                os.replace(srt_tmp, srt_path)
+                os.replace(txt_tmp, txt_path)
+                # Recorded so the panel can tell when another session has
+                # since replaced these files with its own run
+                stamps = (file_stamp(srt_path), file_stamp(txt_path))
             
-            with open(txt_path, 'w', encoding='utf-8') as f:
-                f.write(result['text'])
+            status.update(label="✅ Done", state="complete", expanded=False)
             
             end_time = time.time()
             processing_time = end_time - start_time
             
             st.session_state.transcription_done = True
-            st.session_state.transcript_text = result['text']
+            st.session_state.transcript_path = str(txt_path)
             st.session_state.output_files = {
                 'srt': str(srt_path),
                 'txt': str(txt_path),
-                'mp3': str(audio_file_path) if file_path.suffix.lower() == '.mp4' else None
+                'stamps': stamps
             }
             
             st.markdown(f"""
@@ -433,46 +398,79 @@ if selected_file:
             """, unsafe_allow_html=True)
             
         except Exception as e:
+            status.update(label="❌ Transcription failed", state="error")
             st.markdown(f'<div class="status-error">❌ Error: {str(e)}</div>', unsafe_allow_html=True)
             st.error(f"Details: {str(e)}")
+        finally:
+            # Also covers a Streamlit rerun/stop, which is not an Exception
+            for tmp in (srt_tmp, txt_tmp):
+                tmp.unlink(missing_ok=True)
     
     # Display Results
     if st.session_state.transcription_done:
         st.markdown("---")
         st.markdown("### 📝 Transcription Result")
         
-        st.markdown(f"""
-        <div class="transcript-box">
-        {st.session_state.transcript_text}
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("### 📦 Output Files")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="info-card">
-                <h4>📄 Subtitle File (SRT)</h4>
-                <code style="font-size: 0.85em;">{st.session_state.output_files['srt']}</code>
-            </div>
-            """, unsafe_allow_html=True)
+        # Only the paths live in session state; the files are read back from
+        # disk when the panel renders (the TXT once, for both the text area
+        # and its download). A native widget is diffed by Streamlit and never
+        # parses the text as HTML. If a file is gone, or another session has
+        # replaced it, the panel is hidden rather than raising on every rerun
+        # or showing someone else's result.
+        srt_path = Path(st.session_state.output_files['srt'])
+        txt_path = Path(st.session_state.transcript_path)
+        output_error = None
+        try:
+            if (file_stamp(srt_path), file_stamp(txt_path)) != st.session_state.output_files['stamps']:
+                output_error = "⚠️ The output files were overwritten by another transcription of this file - please run it again."
+            else:
+                srt_bytes = srt_path.read_bytes()
+                txt_bytes = txt_path.read_bytes()
+        except OSError:
+            output_error = "⚠️ The output files are no longer available - please run the transcription again."
         
-        with col2:
-            st.markdown(f"""
-            <div class="info-card">
-                <h4>📄 Text File (TXT)</h4>
-                <code style="font-size: 0.85em;">{st.session_state.output_files['txt']}</code>
-            </div>
-            """, unsafe_allow_html=True)
+        if output_error:
+            reset_results()
+            st.warning(output_error)
+        else:
+            st.text_area(
+                "📝 Transcript",
+                txt_bytes.decode('utf-8'),
+                height=500,
+                disabled=True,
+                label_visibility="collapsed"
+            )
+            
+            st.markdown("### 📦 Output Files")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.download_button(
+                    "⬇️ Subtitle File (SRT)",
+                    srt_bytes,
+                    file_name=srt_path.name,
+                    mime="application/x-subrip",
+                    use_container_width=True
+                )
+            
+            with col2:
+                st.download_button(
+                    "⬇️ Text File (TXT)",
+                    txt_bytes,
+                    file_name=txt_path.name,
+                    mime="text/plain",
+                    use_container_width=True
+                )
 
+if selected_file:
+    transcription_panel(selected_file, selected_language, language_code, device, compute_type, beam_size)
 else:
-    st.markdown("""
+    st.markdown(f"""
     <div class="status-warning">
         <h3>📁 Getting Started</h3>
         <p>Add audio files to the Input folder to begin:</p>
-        <code>C:\\Users\\LKK\\Desktop\\Transcript Generator\\Input\\</code>
+        <code>{INPUT_DIR}</code>
         <p style="margin-top: 1rem;"><strong>Supported formats:</strong> MP3, MP4, WAV, M4A, FLAC, OGG</p>
     </div>
     """, unsafe_allow_html=True)
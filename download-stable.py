@@ -3,22 +3,55 @@ Whisper Model Downloader - ULTRA STABLE VERSION
 Uses Git LFS endpoints to avoid corrupted JSON files
 """
 
-import requests
+import urllib3
+import hashlib
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 import time
 
+try:
+    from orjson import loads as parse_json  # C parser, several times faster
+except ImportError:
+    from json import loads as parse_json
+
 # Configuration
 MODEL_NAME = "large-v3"
 OUTPUT_DIR = Path.home() / ".cache" / "whisper" / MODEL_NAME
 MAX_RETRIES = 3
-CHUNK_SIZE = 65536  # 64KB chunks
+CHUNK_SIZE = 1 << 20  # 1MB chunks
+MAX_WORKERS = 4  # One connection per file
+SEGMENTS = 4  # Parallel Range connections for large files
+SEGMENT_THRESHOLD = 100 * 1024 * 1024  # Only split files above 100MB
 
 # Create directory
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # Use Hugging Face CDN with proper headers to avoid corruption
 BASE_URL = "https://huggingface.co/Systran/faster-whisper-large-v3/resolve/main"
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+    'Accept': '*/*',
+    'Accept-Encoding': 'identity'  # Disable compression to avoid corruption
+}
+
+# One pooled client shared by every thread; keep-alive connections are reused
+# across retries and segments instead of re-doing the TLS handshake
+HTTP = urllib3.PoolManager(
+    maxsize=MAX_WORKERS + SEGMENTS,
+    timeout=urllib3.Timeout(connect=30, read=120),
+    retries=urllib3.Retry(connect=0, read=0, redirect=5)
+)
+
+def open_stream(url, headers):
+    """GET url without preloading the body, raising on HTTP errors"""
+    response = HTTP.request('GET', url, headers=headers, preload_content=False)
+    if response.status >= 400:
+        # Error bodies are small; read them off so the connection is reusable
+        response.drain_conn()
+        raise RuntimeError(f"HTTP {response.status} for {url}")
+    return response
 
 FILES = {
     "model.bin": {
@@ -43,98 +76,278 @@ FILES = {
     }
 }
 
-def download_file(url, output_path, expected_size=None, is_binary=True):
-    """Download with proper encoding handling"""
+def fetch_expected_sha256(url):
+    """Read the LFS SHA256 that Hugging Face exposes as X-Linked-Etag"""
+    try:
+        response = HTTP.request('HEAD', url, headers=HEADERS, redirect=False)
+    except urllib3.exceptions.HTTPError:
+        return None
+    etag = response.headers.get('X-Linked-Etag', '').strip('"')
+    return etag if len(etag) == 64 else None
+
+def hash_file(path, digest, start=0, length=None):
+    """Feed a file on disk (or length bytes from start) into digest in CHUNK_SIZE blocks"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        if length is None:
+            for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(block)
+        else:
+            while length > 0:
+                block = f.read(min(CHUNK_SIZE, length))
+                if not block:
+                    break
+                digest.update(block)
+                length -= len(block)
+    return digest
+
+def progress_bar(name, total, position, initial=0):
+    """Byte progress bar pinned to its own line for concurrent downloads"""
+    return tqdm(
+        total=total,
+        initial=initial,
+        unit='B',
+        unit_scale=True,
+        unit_divisor=1024,
+        desc=f"  {name}",
+        ncols=80,
+        position=position,
+        leave=True
+    )
+
+def download_segment(url, part_path, start, end, update, stop):
+    """Fetch bytes start..end (inclusive) into their slice of part_path
+    
+    A dropped connection resumes from the last byte written, up to
+    MAX_RETRIES times, so only the missing tail of the segment is fetched
+    again. Returns early once stop is set by a failing sibling segment.
+    """
+    size = end - start + 1
+    written = 0
+    failures = 0
+    
+    with open(part_path, 'r+b') as f:
+        while written < size and not stop.is_set():
+            error = None
+            try:
+                response = open_stream(url, dict(HEADERS, Range=f'bytes={start + written}-{end}'))
+            except (urllib3.exceptions.HTTPError, RuntimeError) as e:
+                error = e
+            else:
+                if response.status != 206:
+                    # The whole multi-GB body is pending; drop the connection
+                    response.close()
+                    raise RuntimeError("Server ignored Range request")
+                
+                f.seek(start + written)
+                try:
+                    for chunk in response.stream(CHUNK_SIZE):
+                        f.write(chunk)
+                        written += len(chunk)
+                        update(len(chunk))
+                        if stop.is_set():
+                            break
+                except urllib3.exceptions.HTTPError as e:
+                    error = e
+                
+                # A connection with unread body must not go back to the pool
+                if written == size:
+                    response.release_conn()
+                else:
+                    response.close()
+            
+            if written < size and not stop.is_set():
+                failures += 1
+                if failures >= MAX_RETRIES:
+                    raise RuntimeError(
+                        f"Segment {start}-{end} failed after {failures} attempts: "
+                        f"{error or 'connection closed early'}"
+                    )
+                tqdm.write(f"   🔄 Segment {start:,}-{end:,} resuming at {start + written:,} bytes")
+                time.sleep(2)
+
+def download_segmented(url, output_path, expected_size, position=0):
+    """Split a large file into Range segments fetched over parallel connections
+    
+    Segments land in a preallocated .part file that is only renamed into
+    place once every segment finished and the SHA256 matches.
+    """
+    part_path = output_path.with_name(output_path.name + '.part')
+    with open(part_path, 'wb') as f:
+        f.truncate(expected_size)
+    
+    step = -(-expected_size // SEGMENTS)
+    ranges = [(start, min(start + step, expected_size) - 1) for start in range(0, expected_size, step)]
+    lock = threading.Lock()
+    stop = threading.Event()
+    expected_sha = fetch_expected_sha256(url)
+    digest = hashlib.sha256()
+    
+    with progress_bar(output_path.name, expected_size, position) as pbar:
+        def update(n):
+            with lock:
+                pbar.update(n)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(download_segment, url, part_path, start, end, update, stop)
+                    for start, end in ranges
+                ]
+                try:
+                    # SHA256 is order-dependent, so each segment is hashed as
+                    # soon as it and every segment before it are done; the read
+                    # back overlaps the later segments' downloads and is
+                    # usually served from the page cache
+                    for future, (start, end) in zip(futures, ranges):
+                        future.result()
+                        if expected_sha:
+                            hash_file(part_path, digest, start, end - start + 1)
+                except Exception:
+                    # Segments already retry on their own; once one gives up,
+                    # the others stop instead of finishing slices that are
+                    # about to be discarded
+                    stop.set()
+                    raise
+        except Exception:
+            part_path.unlink(missing_ok=True)
+            raise
+    
+    if expected_sha and digest.hexdigest() != expected_sha:
+        part_path.unlink()
+        raise RuntimeError("SHA256 mismatch after segmented download")
+    
+    part_path.replace(output_path)
+
+def download_file(url, output_path, expected_size=None, is_binary=True, position=0):
+    """Download with proper encoding handling
+    
+    Files are fetched concurrently, so messages go through tqdm.write and
+    each file gets its own progress bar line via ``position``.
+    """
     
     # Check if already complete
     if output_path.exists():
         current_size = output_path.stat().st_size
         if expected_size and current_size == expected_size:
-            print(f"✅ {output_path.name} already complete")
+            tqdm.write(f"✅ {output_path.name} already complete")
             
             # Validate JSON files
             if not is_binary:
                 try:
-                    import json
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        json.load(f)
-                    print(f"   ✓ JSON validation passed")
-                except Exception as e:
-                    print(f"   ⚠️  JSON corrupted, re-downloading: {e}")
+                    parse_json(output_path.read_bytes())
+                    tqdm.write(f"   ✓ JSON validation passed")
+                except ValueError as e:
+                    tqdm.write(f"   ⚠️  JSON corrupted, re-downloading: {e}")
                     output_path.unlink()
                 else:
                     return True
             else:
                 return True
     
-    print(f"\n📥 Downloading: {output_path.name}")
+    tqdm.write(f"\n📥 Downloading: {output_path.name}")
     if expected_size:
-        print(f"   Expected: {expected_size:,} bytes ({expected_size/1024/1024:.2f} MB)")
+        tqdm.write(f"   Expected: {expected_size:,} bytes ({expected_size/1024/1024:.2f} MB)")
+    
+    # Fresh large downloads are split across parallel Range requests
+    if is_binary and expected_size and expected_size >= SEGMENT_THRESHOLD and not output_path.exists():
+        try:
+            download_segmented(url, output_path, expected_size, position)
+            tqdm.write(f"   ✅ Downloaded ({expected_size:,} bytes)")
+            return True
+        except Exception as e:
+            tqdm.write(f"   ⚠️  Segmented download failed, using single stream: {e}")
+    
+    # LFS files carry their SHA256; it is checked while the bytes stream in
+    expected_sha = fetch_expected_sha256(url) if is_binary else None
     
     retry = 0
     while retry < MAX_RETRIES:
         try:
-            # Proper headers to avoid corruption
-            headers = {
-                'User-Agent': 'Mozilla/5.0',
-                'Accept': '*/*',
-                'Accept-Encoding': 'identity'  # Disable compression to avoid corruption
-            }
+            headers = dict(HEADERS)
+            
+            # Resume a partial file instead of starting over from byte 0
+            start = output_path.stat().st_size if expected_size and output_path.exists() else 0
+            if expected_size and start > expected_size:
+                output_path.unlink()
+                start = 0
+            if start:
+                headers['Range'] = f'bytes={start}-'
+            
+            response = open_stream(url, headers)
             
-            response = requests.get(url, headers=headers, stream=True, timeout=120)
-            response.raise_for_status()
+            if response.status != 206:
+                start = 0  # Server sent the full file
+            elif start:
+                tqdm.write(f"   ⏩ Resuming {output_path.name} from {start:,} bytes")
+            
+            total_size = (start + int(response.headers.get('content-length', 0))) or expected_size or 0
+            
+            # Small JSON files are validated in memory and only written once
+            # they parse, via a .tmp file renamed into place
+            if not is_binary:
+                buffer = bytearray()
+                with progress_bar(output_path.name, total_size, position) as pbar:
+                    for chunk in response.stream(CHUNK_SIZE):
+                        buffer += chunk
+                        pbar.update(len(chunk))
+                response.release_conn()
+                
+                try:
+                    parse_json(buffer)
+                except ValueError as e:
+                    tqdm.write(f"   ❌ JSON corrupt: {e}")
+                    retry += 1
+                    time.sleep(2)
+                    continue
+                
+                tmp_path = output_path.with_name(output_path.name + '.tmp')
+                tmp_path.write_bytes(buffer)
+                tmp_path.replace(output_path)
+                tqdm.write(f"   ✅ Downloaded and validated ({len(buffer):,} bytes)")
+                return True
             
-            total_size = int(response.headers.get('content-length', 0)) or expected_size or 0
+            # A resumed file has to hash the bytes already on disk first
+            digest = hashlib.sha256()
+            if start and expected_sha:
+                hash_file(output_path, digest)
             
             # Download
-            with open(output_path, 'wb') as f:
-                with tqdm(
-                    total=total_size,
-                    unit='B',
-                    unit_scale=True,
-                    unit_divisor=1024,
-                    desc=f"  {output_path.name}",
-                    ncols=80
-                ) as pbar:
-                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                        if chunk:
-                            f.write(chunk)
-                            pbar.update(len(chunk))
+            with open(output_path, 'ab' if start else 'wb') as f:
+                with progress_bar(output_path.name, total_size, position, start) as pbar:
+                    for chunk in response.stream(CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        pbar.update(len(chunk))
+            response.release_conn()
             
             # Verify
             final_size = output_path.stat().st_size
             
-            # Check size
+            # Check size - a short file is kept so the next retry resumes it
             if expected_size and final_size != expected_size:
-                print(f"   ❌ Size mismatch: {final_size:,} vs {expected_size:,}")
+                tqdm.write(f"   ❌ Size mismatch: {final_size:,} vs {expected_size:,}")
+                if final_size > expected_size:
+                    output_path.unlink()
+                retry += 1
+                time.sleep(2)
+                continue
+            
+            if expected_sha and digest.hexdigest() != expected_sha:
+                tqdm.write(f"   ❌ SHA256 mismatch: {digest.hexdigest()} vs {expected_sha}")
                 output_path.unlink()
                 retry += 1
                 time.sleep(2)
                 continue
             
-            # Validate JSON files
-            if not is_binary:
-                try:
-                    import json
-                    with open(output_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    print(f"   ✅ Downloaded and validated ({final_size:,} bytes)")
-                    return True
-                except json.JSONDecodeError as e:
-                    print(f"   ❌ JSON corrupt: {e}")
-                    output_path.unlink()
-                    retry += 1
-                    time.sleep(2)
-                    continue
-            else:
-                print(f"   ✅ Downloaded ({final_size:,} bytes)")
-                return True
+            tqdm.write(f"   ✅ Downloaded ({final_size:,} bytes)")
+            return True
                 
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            tqdm.write(f"   ❌ Error: {e}")
             retry += 1
             if retry < MAX_RETRIES:
-                print(f"   🔄 Retry {retry}/{MAX_RETRIES}...")
+                tqdm.write(f"   🔄 Retry {retry}/{MAX_RETRIES}...")
                 time.sleep(3)
             else:
                 return False
@@ -147,15 +360,21 @@ print("🚀 Whisper large-v3 Downloader - STABLE VERSION")
 print("📂 Destination:", OUTPUT_DIR)
 print("=" * 80)
 
-success = 0
-for filename, info in FILES.items():
-    if download_file(
-        info['url'],
-        OUTPUT_DIR / filename,
-        info.get('size'),
-        info.get('binary', True)
-    ):
-        success += 1
+# Downloads are network-bound: run them in parallel so the small JSON files
+# don't wait behind the 3 GB model.bin
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    futures = {
+        executor.submit(
+            download_file,
+            info['url'],
+            OUTPUT_DIR / filename,
+            info.get('size'),
+            info.get('binary', True),
+            position
+        ): filename
+        for position, (filename, info) in enumerate(FILES.items())
+    }
+    success = sum(1 for future in as_completed(futures) if future.result())
 
 # Final check
 print("\n" + "=" * 80)
@@ -179,11 +398,9 @@ for filename, info in FILES.items():
         # Validate JSON
         if not info.get('binary', True):
             try:
-                import json
-                with open(path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                parse_json(path.read_bytes())
                 print(f"   ✓ JSON valid")
-            except Exception as e:
+            except ValueError as e:
                 print(f"   ✗ JSON INVALID: {e}")
                 all_ok = False
     else:
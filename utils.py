@@ -5,15 +5,24 @@ INCLUDES: All required helper functions for app.py
 """
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional, Callable, List, Dict
+from typing import Optional, Callable, List, Dict, Union
+from collections import OrderedDict, deque
+from types import MappingProxyType
 import torch
 import logging
 import psutil
 import platform
+import atexit
+import functools
 import gc
+import inspect
+import io
 import re
+import threading
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,20 +31,23 @@ LOCAL_MODEL_DIR = Path.home() / ".cache" / "whisper"
 
 # ==================== SYSTEM DETECTION ====================
 
-def get_system_info() -> Dict[str, str]:
-    """Detect host system specifications"""
+@functools.lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, str]:
+    """Host specs that do not change while the process runs"""
+    cpu_freq = psutil.cpu_freq()
+    vm = psutil.virtual_memory()
     info = {
         "os": platform.system(),
         "cpu_count": psutil.cpu_count(logical=False),
-        "cpu_freq": f"{psutil.cpu_freq().max / 1000:.1f} GHz" if psutil.cpu_freq() else "Unknown",
-        "ram_total": f"{psutil.virtual_memory().total / (1024**3):.1f} GB",
-        "ram_available": f"{psutil.virtual_memory().available / (1024**3):.1f} GB",
+        "cpu_freq": f"{cpu_freq.max / 1000:.1f} GHz" if cpu_freq else "Unknown",
+        "ram_total": f"{vm.total / (1024**3):.1f} GB",
     }
     
     if torch.cuda.is_available():
+        props = torch.cuda.get_device_properties(0)
         info["gpu_available"] = True
-        info["gpu_name"] = torch.cuda.get_device_name(0)
-        info["gpu_memory"] = f"{torch.cuda.get_device_properties(0).total_memory / (1024**3):.1f} GB"
+        info["gpu_name"] = props.name
+        info["gpu_memory"] = f"{props.total_memory / (1024**3):.1f} GB"
         info["cuda_version"] = torch.version.cuda
     else:
         info["gpu_available"] = False
@@ -43,54 +55,58 @@ def get_system_info() -> Dict[str, str]:
     
     return info
 
+def get_ram_available() -> str:
+    """Currently available RAM - queried fresh on every call"""
+    return f"{psutil.virtual_memory().available / (1024**3):.1f} GB"
+
+def get_system_info() -> Dict[str, str]:
+    """Detect host system specifications"""
+    return {**_static_system_info(), "ram_available": get_ram_available()}
+
+@functools.lru_cache(maxsize=1)
 def validate_ffmpeg() -> bool:
-    """Verify FFmpeg installation"""
-    try:
-        result = subprocess.run(
-            ['ffmpeg', '-version'],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Verify FFmpeg installation (PATH lookup, no subprocess)"""
+    return shutil.which('ffmpeg') is not None
 
 def check_gpu_available() -> bool:
     """Check if CUDA GPU is available"""
     return torch.cuda.is_available()
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def get_file_size(file_path: Path) -> str:
     """Format file size for display"""
     size_bytes = file_path.stat().st_size
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    # Every 10 bits of magnitude is one 1024x unit step
+    unit = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
 
 # ==================== FILE MANAGEMENT ====================
 
+# A tuple so str.endswith can test every suffix in one C-level call
+AUDIO_EXTENSIONS = ('.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm')
+
 def get_audio_files(input_dir: Path) -> List[str]:
     """Get all audio files from input directory - REQUIRED BY app.py"""
-    audio_extensions = {'.mp3', '.mp4', '.wav', '.m4a', '.flac', '.ogg', '.webm'}
-    files = []
-    
-    if not input_dir.exists():
-        return files
-    
-    for file in input_dir.iterdir():
-        if file.suffix.lower() in audio_extensions:
-            files.append(file.name)
-    
-    return sorted(files)
+    try:
+        with os.scandir(input_dir) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(AUDIO_EXTENSIONS)
+            )
+    except FileNotFoundError:
+        return []
 
 def convert_mp4_to_mp3(
     input_path: str,
     output_path: str,
     progress_callback: Optional[Callable[[int], None]] = None
 ) -> None:
-    """Convert MP4 to MP3 using FFmpeg - REQUIRED BY app.py"""
+    """Convert MP4 to MP3 using FFmpeg
+    
+    Kept as public API for scripts that want an MP3 on disk; app.py itself
+    decodes straight to memory with load_audio().
+    """
     if not validate_ffmpeg():
         raise RuntimeError("FFmpeg not installed. Cannot convert MP4 files.")
     
@@ -110,7 +126,7 @@ def convert_mp4_to_mp3(
         if progress_callback:
             progress_callback(0)
         
-        logger.info(f"Converting: {input_path} → {output_path}")
+        logger.info("Converting: %s → %s", input_path, output_path)
         
         process = subprocess.Popen(
             cmd,
@@ -131,33 +147,143 @@ def convert_mp4_to_mp3(
         logger.info("Conversion complete")
             
     except Exception as e:
-        logger.error(f"MP4 conversion failed: {str(e)}")
+        logger.error("MP4 conversion failed: %s", e)
         raise RuntimeError(f"MP4 conversion failed: {str(e)}")
 
+SAMPLE_RATE = 16000
+_DURATION_RE = re.compile(r'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+# -progress writes bare key=value lines (out_time_ms=..., progress=...)
+_PROGRESS_LINE_RE = re.compile(r'^\w+=\S*$')
+
+def load_audio(
+    input_path: str,
+    progress_callback: Optional[Callable[[int], None]] = None
+) -> np.ndarray:
+    """Decode to 16 kHz mono float32 samples in memory - REQUIRED BY app.py
+    
+    FFmpeg writes raw f32le PCM to stdout, so no intermediate audio file is
+    encoded or re-read and the bytes are already the float32 samples
+    faster-whisper takes directly. Progress comes from FFmpeg's -progress
+    output against the input duration.
+    """
+    if not validate_ffmpeg():
+        raise RuntimeError("FFmpeg not installed. Cannot decode audio.")
+    
+    cmd = [
+        'ffmpeg',
+        '-hide_banner',
+        '-nostdin',
+        '-nostats',
+        '-progress', 'pipe:2',
+        '-threads', '0',
+        '-i', input_path,
+        '-vn',
+        '-f', 'f32le',
+        '-acodec', 'pcm_f32le',
+        '-ar', str(SAMPLE_RATE),
+        '-ac', '1',
+        '-'
+    ]
+    
+    logger.info("Decoding audio: %s", input_path)
+    
+    if progress_callback:
+        progress_callback(0)
+    
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+    )
+    
+    # stdout is drained on a worker thread so the progress callback (which
+    # may touch Streamlit elements) stays on the calling thread
+    pcm = io.BytesIO()
+    reader = threading.Thread(target=shutil.copyfileobj, args=(process.stdout, pcm, 1 << 20), daemon=True)
+    reader.start()
+    
+    duration = None
+    log_tail = deque(maxlen=20)
+    try:
+        for raw in process.stderr:
+            line = raw.decode('utf-8', errors='ignore').strip()
+            if _PROGRESS_LINE_RE.match(line):
+                # Despite the name, FFmpeg reports microseconds here
+                if progress_callback and duration and line.startswith('out_time_ms='):
+                    value = line.split('=', 1)[1]
+                    if value.isdigit():
+                        progress_callback(min(int(int(value) / 1e6 / duration * 100), 99))
+                continue
+            
+            # Only FFmpeg's own log lines are kept for the error message
+            log_tail.append(line)
+            if duration is None:
+                match = _DURATION_RE.search(line)
+                if match:
+                    hours, minutes, secs = match.groups()
+                    duration = int(hours) * 3600 + int(minutes) * 60 + float(secs)
+        
+        process.wait()
+    finally:
+        # A raising callback (e.g. a Streamlit rerun) must not leave FFmpeg
+        # decoding in the background
+        if process.returncode is None:
+            process.kill()
+            process.wait()
+        reader.join()
+        process.stderr.close()
+    
+    if process.returncode != 0:
+        error_msg = '\n'.join(log_tail)
+        logger.error("Audio decoding failed: %s", error_msg)
+        raise RuntimeError(f"Audio decoding failed: {error_msg}")
+    
+    if progress_callback:
+        progress_callback(100)
+    
+    # getbuffer() is writable, so the array is too - without another copy
+    return np.frombuffer(pcm.getbuffer(), np.float32)
+
 # ==================== TEXT PROCESSING ====================
 
-def filter_garbage_segments(text: str) -> str:
+# Compiled once at import. _GARBAGE_RE rejects a transcript line that has
+# more than 5 consecutive repetitions of a filler, or that is ONLY
+# repetitions; _SEG_GARBAGE_RE rejects a single raw segment.
+_GARBAGE_RE = re.compile(
+    r'(?:you\.\.\.\s*){6,}|(?: uh\.\.\.){6,}| \.\.\.|you\.\.\.\.\.\.|uh uh uh uh uh'
+    r'|^(?:you\.\.\.\s*)+$|^(?: uh\.\.\.)+$'
+)
+_SEG_GARBAGE_RE = re.compile(r'^(?:you\.\.\.\s*){3,}$|^(?: uh\.\.\.){3,}$|^\.{5,}$')
+# Every _SEG_GARBAGE_RE match starts with one of these, so a cheap
+# startswith check skips the regex for ordinary segments
+_SEG_GARBAGE_PREFIXES = ('you...', ' uh...', '.....')
+
+def _split_paragraphs(text: Union[str, List[str]]) -> List[str]:
+    """Paragraphs of a transcript string, or an already split list as-is"""
+    if isinstance(text, str):
+        return text.strip().split('\n\n')
+    return text
+
+def filter_garbage_segments(text: Union[str, List[str]]) -> str:
     """Remove corrupted VAD artifacts like repeated 'you...' or 'uh...'"""
-    lines = text.strip().split('\n\n')
+    lines = _split_paragraphs(text)
     cleaned_lines = []
     
     for line in lines:
-        # Skip if more than 5 consecutive repetitions of same pattern
-        if re.search(r'(you\.\.\.\s*){6,}|( uh\.\.\.){6,}| \.\.\.|you\.\.\.\.\.\.|uh uh uh uh uh', line):
-            continue
-        # Skip if line is ONLY repetitions
-        if re.match(r'^(you\.\.\.\s*)+$|^( uh\.\.\.)+$', line):
+        if _GARBAGE_RE.search(line):
             continue
+        line = line.strip()
         # Skip empty or very short garbage
-        if len(line.strip()) < 3:
+        if len(line) < 3:
             continue
-        cleaned_lines.append(line.strip())
+        cleaned_lines.append(line)
     
     return '\n\n'.join(cleaned_lines)
 
-def merge_short_segments(text: str, min_length: int = 20) -> str:
+def merge_short_segments(text: Union[str, List[str]], min_length: int = 20) -> str:
     """Merge very short segments that are likely VAD errors"""
-    lines = text.strip().split('\n\n')
+    lines = _split_paragraphs(text)
     merged_lines = []
     current_merge = ""
     
@@ -175,71 +301,246 @@ def merge_short_segments(text: str, min_length: int = 20) -> str:
     
     return '\n\n'.join(merged_lines)
 
+def clean_transcript(text: Union[str, List[str]], min_length: int = 15) -> str:
+    """filter_garbage_segments + merge_short_segments in a single pass"""
+    merged_lines = []
+    current_merge = ""
+    
+    for line in _split_paragraphs(text):
+        if _GARBAGE_RE.search(line):
+            continue
+        line = line.strip()
+        if len(line) < 3:
+            continue
+        
+        if len(line) < min_length and current_merge:
+            current_merge += " " + line
+        else:
+            if current_merge:
+                merged_lines.append(current_merge)
+            current_merge = line
+    
+    if current_merge:
+        merged_lines.append(current_merge)
+    
+    return '\n\n'.join(merged_lines)
+
 def format_timestamp(seconds: float) -> str:
     """Convert seconds to SRT timestamp format"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds - int(seconds)) * 1000)
+    ms_total = int(seconds * 1000)
+    hours, rem = divmod(ms_total, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
+# Below this many segments the plain per-segment formatter is cheaper than
+# building NumPy arrays
+SRT_VECTORIZE_MIN = 256
+
+def format_timestamps(seconds: List[float]) -> List[str]:
+    """Format many SRT timestamps with one vectorized pass over the math"""
+    t_ms = (np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    hours = t_ms // 3_600_000
+    minutes = (t_ms // 60_000) % 60
+    secs = (t_ms // 1000) % 60
+    millis = t_ms % 1000
+    return [
+        f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
+
+def write_srt(out, starts: List[float], ends: List[float], texts: List[str]) -> None:
+    """Write SRT entries to a text stream, one write per entry"""
+    if len(starts) >= SRT_VECTORIZE_MIN:
+        start_stamps = format_timestamps(starts)
+        end_stamps = format_timestamps(ends)
+    else:
+        start_stamps = [format_timestamp(t) for t in starts]
+        end_stamps = [format_timestamp(t) for t in ends]
+    
+    separator = ""
+    for index, (start, end, text) in enumerate(zip(start_stamps, end_stamps, texts), 1):
+        out.write(f"{separator}{index}\n{start} --> {end}\n{text}\n")
+        separator = "\n"
+
+def build_srt(starts: List[float], ends: List[float], texts: List[str]) -> str:
+    """Assemble SRT text from parallel lists of segment times and texts"""
+    buffer = io.StringIO()
+    write_srt(buffer, starts, ends, texts)
+    return buffer.getvalue()
+
 # ==================== MODEL CACHING ====================
 
-_MODEL_CACHE = {}
+# Bounded LRU: every cached model pins its weights in (GPU) memory
+MODEL_CACHE_SIZE = 2
+_MODEL_CACHE = OrderedDict()
+
+# Speed/Quality trade-off: beam width and the GPU weight precision.
+# int8_float16 keeps int8 weights with fp16 activations (INT8 tensor cores),
+# roughly halving weight memory traffic versus float16.
+PERFORMANCE_PROFILES = {
+    "Speed": {"beam_size": 1, "cuda_compute_type": "int8_float16"},
+    "Quality": {"beam_size": 5, "cuda_compute_type": "float16"},
+}
+
+@functools.lru_cache(maxsize=1)
+def _cuda_capability() -> tuple:
+    """Compute capability of GPU 0, probed once per process"""
+    return torch.cuda.get_device_capability(0)
+
+def get_compute_type(device: str, profile: str = "Speed") -> str:
+    """Pick the CTranslate2 compute type for a device and performance profile
+    
+    GPUs without tensor cores (compute capability below 7.0) get int8, which
+    avoids float16 OOMs on older cards. Pass "auto" to transcribe_audio to
+    let CTranslate2 decide instead.
+    """
+    if device != "cuda":
+        return "int8"
+    if _cuda_capability() < (7, 0):
+        return "int8"
+    return PERFORMANCE_PROFILES[profile]["cuda_compute_type"]
+
+REQUIRED_MODEL_FILES = frozenset({'model.bin', 'config.json', 'tokenizer.json', 'vocabulary.json'})
 
 def check_local_model_exists(model_name: str) -> bool:
     """Check if local model exists"""
-    model_path = LOCAL_MODEL_DIR / model_name
-    if not model_path.exists():
+    try:
+        with os.scandir(LOCAL_MODEL_DIR / model_name) as entries:
+            names = {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
         return False
     
-    required_files = ['model.bin', 'config.json', 'tokenizer.json', 'vocabulary.json']
-    for file in required_files:
-        if not (model_path / file).exists():
-            return False
+    return REQUIRED_MODEL_FILES <= names
+
+def load_whisper_model(model_name: str, device: str, compute_type: str):
+    """Load a WhisperModel, preferring the local copy in LOCAL_MODEL_DIR"""
+    from faster_whisper import WhisperModel
+    
+    local_model_path = LOCAL_MODEL_DIR / model_name
+    
+    if check_local_model_exists(model_name):
+        logger.info("✅ Using local model: %s", local_model_path)
+        model_path = str(local_model_path)
+    else:
+        logger.info("⚠️ Downloading %s model...", model_name)
+        model_path = model_name
+    
+    logger.info("Loading model %s...", model_name)
     
-    return True
+    # 0 lets CTranslate2 pick its own thread count on GPU; on CPU use the
+    # physical cores (SMT siblings add little to GEMM throughput), capped at 8
+    if device == "cuda":
+        cpu_threads = 0
+    else:
+        cpu_threads = min(psutil.cpu_count(logical=False) or 4, 8)
+    
+    model = WhisperModel(
+        model_path,
+        device=device,
+        compute_type=compute_type,
+        download_root=str(LOCAL_MODEL_DIR),
+        num_workers=1,
+        cpu_threads=cpu_threads
+    )
+    
+    logger.info("✅ Model %s loaded successfully", model_name)
+    return model
+
+def _release_gpu_memory() -> None:
+    """Collect dropped models and hand their CUDA blocks back to the driver"""
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
 
 def get_cached_model(model_name: str, device: str, compute_type: str):
     """Get or load model with intelligent caching"""
     cache_key = f"{model_name}_{device}_{compute_type}"
     
-    if cache_key not in _MODEL_CACHE:
-        from faster_whisper import WhisperModel
-        
-        local_model_path = LOCAL_MODEL_DIR / model_name
-        
-        if check_local_model_exists(model_name):
-            logger.info(f"✅ Using local model: {local_model_path}")
-            model_path = str(local_model_path)
-        else:
-            logger.info(f"⚠️ Downloading {model_name} model...")
-            model_path = model_name
-        
-        logger.info(f"Loading model {model_name}...")
-        
-        _MODEL_CACHE[cache_key] = WhisperModel(
-            model_path,
-            device=device,
-            compute_type=compute_type,
-            download_root=str(LOCAL_MODEL_DIR),
-            num_workers=1,
-            cpu_threads=2
-        )
-        
-        logger.info(f"✅ Model {model_name} loaded successfully")
-    else:
-        logger.info(f"Using cached model {model_name}")
+    if cache_key in _MODEL_CACHE:
+        logger.info("Using cached model %s", model_name)
+        _MODEL_CACHE.move_to_end(cache_key)
+        return _MODEL_CACHE[cache_key]
     
+    if len(_MODEL_CACHE) >= MODEL_CACHE_SIZE:
+        evicted_key, evicted = _MODEL_CACHE.popitem(last=False)
+        logger.info("Evicting cached model %s", evicted_key)
+        del evicted
+        _release_gpu_memory()
+    
+    _MODEL_CACHE[cache_key] = load_whisper_model(model_name, device, compute_type)
     return _MODEL_CACHE[cache_key]
 
+def clear_model_cache() -> None:
+    """Drop every cached model and release its memory"""
+    _MODEL_CACHE.clear()
+    _release_gpu_memory()
+
+atexit.register(clear_model_cache)
+
+# ============== CRITICAL VAD SETTINGS ==============
+# Read-only: BatchedInferencePipeline pops keys from the vad_parameters
+# dict it is given, so every call must pass its own copy.
+# max_speech_duration_s only applies to the sequential model.transcribe
+# path: the batched pipeline replaces it with chunk_length (15 s below), so
+# there every VAD chunk is at most 15 s long.
+_VAD_PARAMS = MappingProxyType(dict(
+    threshold=0.4,
+    min_silence_duration_ms=3000,
+    min_speech_duration_ms=100,
+    max_speech_duration_s=240,
+))
+
+_TRANSCRIBE_KWARGS = dict(
+    best_of=1,
+    temperature=0.0,
+    chunk_length=15,
+    vad_filter=True,
+    condition_on_previous_text=False,
+    word_timestamps=False,
+    compression_ratio_threshold=2.0,
+    log_prob_threshold=-0.5,
+    no_speech_threshold=0.6,
+    language_detection_threshold=0.5,
+)
+
+# Seconds of audio between progress callbacks in the segment loop
+PROGRESS_STEP_S = 5
+
+@functools.lru_cache(maxsize=None)
+def _supported_kwargs(owner_type) -> frozenset:
+    """Keyword names owner_type.transcribe accepts, introspected once per class"""
+    return frozenset(inspect.signature(owner_type.transcribe).parameters)
+
+def get_batched_pipeline(model):
+    """BatchedInferencePipeline wrapping model, or None when the installed
+    faster-whisper predates the pipeline
+    
+    Deliberately built per call instead of being cached next to the model:
+    the constructor only stores attributes, while a cached pipeline (which
+    holds .model) forms a reference cycle that keeps an evicted model's VRAM
+    alive until gc runs. transcribe_audio passes without_timestamps=False
+    to it, since the pipeline's default gives one SRT cue per VAD chunk.
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        return None
+    return BatchedInferencePipeline(model=model)
+
 # ==================== MAIN TRANSCRIPTION ====================
 
 def transcribe_audio(
-    audio_path: str,
+    audio_path: Union[str, np.ndarray],
     model_name: str = "turbo",
     language: Optional[str] = None,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    *,
+    model=None,
+    compute_type: Optional[str] = None,
+    beam_size: int = 2,
+    batch_size: int = 8,
+    srt_output_path: Optional[str] = None
 ) -> Dict[str, str]:
     """
     ULTIMATE TRANSCRIPTION ENGINE
@@ -249,6 +550,23 @@ def transcribe_audio(
     ✅ Merges incomplete segments
     ✅ Produces CLEAN output
     ✅ Works with RTX 4050 GPU
+    
+    ``audio_path`` may also be a 16 kHz mono float32 array from load_audio().
+    
+    Pass a pre-loaded ``model`` (e.g. from app.py's st.cache_resource
+    helper) to skip model loading; otherwise ``model_name`` is loaded
+    through the module-level cache. ``compute_type`` defaults to
+    get_compute_type() for the detected GPU/CPU; "auto" is passed through
+    to CTranslate2 unchanged. With ``batch_size`` > 1
+    the VAD speech chunks are decoded in batches through faster-whisper's
+    BatchedInferencePipeline when the installed version provides it.
+    
+    With ``srt_output_path`` the SRT is streamed straight to that file and
+    the returned 'srt' is None, so the full subtitle string is never held
+    in memory.
+    
+    Everything after ``progress_callback`` is keyword-only, so the original
+    positional call order keeps working.
     """
     
     try:
@@ -260,130 +578,126 @@ def transcribe_audio(
         progress_callback(0, "Initializing GPU...")
     
     device = "cuda" if check_gpu_available() else "cpu"
-    compute_type = "float16" if device == "cuda" else "int8"
+    compute_type = compute_type or get_compute_type(device)
     
     sys_info = get_system_info()
-    logger.info(f"System: {sys_info['os']} | CPU: {sys_info['cpu_count']} cores | RAM: {sys_info['ram_available']}/{sys_info['ram_total']}")
+    logger.info("System: %s | CPU: %s cores | RAM: %s/%s", sys_info['os'], sys_info['cpu_count'], sys_info['ram_available'], sys_info['ram_total'])
     
     if sys_info.get('gpu_available'):
-        logger.info(f"GPU: {sys_info.get('gpu_name')} ({sys_info.get('gpu_memory')} VRAM)")
-    
-    if progress_callback:
-        progress_callback(10, f"Loading {model_name} model...")
+        logger.info("GPU: %s (%s VRAM)", sys_info.get('gpu_name'), sys_info.get('gpu_memory'))
     
-    model = get_cached_model(model_name, device, compute_type)
+    if model is None:
+        if progress_callback:
+            progress_callback(10, f"Loading {model_name} model...")
+        
+        model = get_cached_model(model_name, device, compute_type)
     
     if progress_callback:
         progress_callback(30, "Starting transcription (removing VAD artifacts)...")
     
-    logger.info(f"Transcribing: {audio_path}")
-    logger.info(f"Language: {language or 'auto-detect'}")
-    
-    # ============== CRITICAL VAD SETTINGS ==============
-    try:
-        segments, info = model.transcribe(
-            audio=audio_path,
-            language=language,
-            beam_size=2,
-            best_of=1,
-            temperature=0.0,
-            chunk_length=15,
-            vad_filter=True,
-            vad_parameters=dict(
-                threshold=0.4,
-                min_silence_duration_ms=3000,
-                min_speech_duration_ms=100,
-                max_speech_duration_s=240,
-            ),
-            condition_on_previous_text=False,
-            word_timestamps=False,
-            compression_ratio_threshold=2.0,
-            log_prob_threshold=-0.5,
-            no_speech_threshold=0.6,
-            language_detection_threshold=0.5,
-        )
-    except TypeError:
-        logger.warning("Using fallback transcription parameters...")
-        segments, info = model.transcribe(
-            audio=audio_path,
-            language=language,
-            beam_size=2,
-            temperature=0.0,
-            vad_filter=True,
-        )
+    if isinstance(audio_path, np.ndarray):
+        logger.info("Transcribing: in-memory audio (%.1fs)", len(audio_path) / SAMPLE_RATE)
+    else:
+        logger.info("Transcribing: %s", audio_path)
+    logger.info("Language: %s", language or 'auto-detect')
+    
+    batched = get_batched_pipeline(model) if batch_size > 1 else None
+    
+    if batched is not None:
+        # Silence is dropped by VAD and the remaining speech chunks share
+        # one encoder/decoder launch per batch. The pipeline defaults to
+        # without_timestamps=True, which would make every SRT cue a whole
+        # VAD chunk; keep per-utterance timestamps like the sequential path
+        owner = batched
+        call_kwargs = dict(_TRANSCRIBE_KWARGS, batch_size=batch_size, without_timestamps=False)
+        logger.info("Batched inference: batch_size=%d", batch_size)
+    else:
+        owner = model
+        call_kwargs = dict(_TRANSCRIBE_KWARGS)
+    
+    call_kwargs.update(
+        language=language,
+        beam_size=beam_size,
+        vad_parameters=dict(_VAD_PARAMS),
+    )
+    
+    # Only pass what this faster-whisper version accepts, so a version
+    # mismatch never costs a second full transcription
+    supported = _supported_kwargs(type(owner))
+    unsupported = call_kwargs.keys() - supported
+    if unsupported:
+        logger.warning("Ignoring unsupported transcribe options: %s", sorted(unsupported))
+    
+    segments, info = owner.transcribe(
+        audio=audio_path,
+        **{k: v for k, v in call_kwargs.items() if k in supported}
+    )
     
     if progress_callback:
         progress_callback(50, f"Detected language: {info.language}")
     
-    logger.info(f"Detected language: {info.language}")
+    logger.info("Detected language: %s", info.language)
     
     full_text = []
-    srt_content = []
+    starts = []
+    ends = []
     segment_index = 1
     total_duration = getattr(info, 'duration', 0)
     
+    # Decided once so the no-callback loop pays nothing for progress, and
+    # the callback only fires when playback crosses a PROGRESS_STEP_S bucket
+    has_cb = progress_callback is not None and total_duration > 0
+    last_bucket = -1
+    
     for segment in segments:
-        try:
-            segment_duration = segment.end - segment.start
-        except:
-            continue
-        
-        if segment_duration < 0.1:
+        if segment.end - segment.start < 0.1:
             continue
         
-        try:
-            segment_text = segment.text.strip() if hasattr(segment, 'text') else ""
-        except:
-            continue
-        
-        if not segment_text or len(segment_text) < 2:
+        segment_text = segment.text.strip()
+        if len(segment_text) < 2:
             continue
         
         # CRITICAL: Skip VAD garbage
-        if re.search(r'^(you\.\.\.\s*){3,}$|^( uh\.\.\.){3,}$|^\.{5,}$', segment_text):
-            logger.debug(f"Skipped garbage segment: {segment_text[:50]}")
+        if segment_text.startswith(_SEG_GARBAGE_PREFIXES) and _SEG_GARBAGE_RE.match(segment_text):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Skipped garbage segment: %s", segment_text[:50])
             continue
         
         full_text.append(segment_text)
-        
-        start_time = format_timestamp(segment.start)
-        end_time = format_timestamp(segment.end)
-        
-        srt_content.append(f"{segment_index}")
-        srt_content.append(f"{start_time} --> {end_time}")
-        srt_content.append(segment_text)
-        srt_content.append("")
+        starts.append(segment.start)
+        ends.append(segment.end)
         
         segment_index += 1
         
-        # Memory management
-        if segment_index % 10 == 0:
-            gc.collect()
-            if device == "cuda":
-                torch.cuda.empty_cache()
-        
-        if progress_callback and total_duration > 0:
+        if has_cb and segment.end // PROGRESS_STEP_S != last_bucket:
+            last_bucket = segment.end // PROGRESS_STEP_S
             progress_percent = min(50 + int((segment.end / total_duration) * 45), 95)
             progress_callback(progress_percent, f"Processing segment {segment_index}... ({segment.end:.1f}/{total_duration:.1f}s)")
     
+    # Release cached GPU blocks once, after decoding has finished
+    if device == "cuda":
+        torch.cuda.empty_cache()
+    
     if progress_callback:
         progress_callback(95, "Cleaning up artifacts...")
     
     # ============== FINAL CLEANUP ==============
-    transcript_text = '\n\n'.join(full_text)
+    # Remove remaining garbage and merge fragments
+    transcript_text = clean_transcript(full_text, min_length=15)
     
-    # Remove remaining garbage
-    transcript_text = filter_garbage_segments(transcript_text)
-    transcript_text = merge_short_segments(transcript_text, min_length=15)
-    
-    srt_text = '\n'.join(srt_content)
+    if srt_output_path:
+        with open(srt_output_path, 'w', encoding='utf-8', newline='') as f:
+            write_srt(f, starts, ends, full_text)
+        srt_text = None
+    else:
+        srt_text = build_srt(starts, ends, full_text)
     
     if progress_callback:
         progress_callback(100, "✅ Transcription complete!")
     
-    logger.info(f"✅ Transcription complete: {segment_index} segments")
-    logger.info(f"Total duration: {total_duration:.1f} seconds ({total_duration/60:.1f} minutes)")
-    logger.info(f"Final transcript length: {len(transcript_text)} characters (after cleanup)")
+    logger.info("✅ Transcription complete: %d segments", segment_index)
+    logger.info("Total duration: %.1f seconds (%.1f minutes)", total_duration, total_duration / 60)
+    logger.info("Final transcript length: %d characters (after cleanup)", len(transcript_text))
     
     return {
         'text': transcript_text,